@@ -1,16 +1,21 @@
 import sys
 sys.path.append('../')
 from sim_utils.utils import *
+from sim_utils.matchups import *
+from sim_utils.random_streams import *
 
+from bisect import bisect_right
 from collections import defaultdict
-import numpy as np
-import copy
 import pprint
 
 pp = pprint.PrettyPrinter(indent=4)
 
+# Roughly the number of PAs in a game, used to size a game's random blocks so
+# one-off seeds and Generators don't pay for a full season-sized block
+GAME_BLOCK_SIZE = 128
 
-def simulate_game(game):
+
+def simulate_game(game, matchups=None, rng=None):
     """
     Simulate a game
 
@@ -18,13 +23,25 @@ def simulate_game(game):
     ----------
     game: Game
         Game object
+    matchups: MatchupCache
+        cache of blended outcome tables (a fresh one with no league rates is
+        used if None, so a Team.pitcher requires passing a cache)
+    rng: int, Generator or RandomStream
+        seed or source of randomness (None for fresh OS entropy)
 
     Returns
     -------
 
     """
-    home_lineup = copy.deepcopy(game.home_team.lineup)
-    away_lineup = copy.deepcopy(game.away_team.lineup)
+    # Shallow copies: the lineups are only rotated, and the Players must stay
+    # the same objects for the matchup tables to be found
+    home_lineup = list(game.home_team.lineup)
+    away_lineup = list(game.away_team.lineup)
+    park = game.home_team.park
+
+    if matchups is None:
+        matchups = MatchupCache()
+    stream = get_random_stream(rng, block_size=GAME_BLOCK_SIZE)
 
     while game.game_state.inning <= 9 or \
             game.game_state.score.home_team_score == \
@@ -38,38 +55,18 @@ def simulate_game(game):
 
         if game.game_state.bottom:
             lineup = home_lineup
+            pitcher = game.away_team.pitcher
         else:
             lineup = away_lineup
+            pitcher = game.home_team.pitcher
 
         if len(lineup) > 0:
             curr_player = lineup.pop(0)
             lineup.append(curr_player)
 
-        PA_result = np.random.choice(
-            [
-                "hit", "walk", "out"
-            ],
-            p=
-            [
-                curr_player.true_BA,
-                curr_player.perc_walk,
-                (1 - curr_player.true_BA - curr_player.perc_walk)
-            ]
-        )
+        PA_cum_probs = matchups.get_cum_probs(curr_player, pitcher, park)
+        PA_result = PA_OUTCOMES[bisect_right(PA_cum_probs, stream.uniform())]
 
-        if PA_result == 'hit':
-            PA_result = np.random.choice(
-                [
-                    1, 2, 3, 4
-                ],
-                p=
-                [
-                    curr_player.perc_singles,
-                    curr_player.perc_doubles,
-                    curr_player.perc_triples,
-                    curr_player.perc_HR
-                ]
-            )
         game.game_state.update_state(PA_result)
 
     # game.print_team_score()
@@ -85,7 +82,7 @@ def simulate_game(game):
     game.away_team.games_played += 1
 
 
-def simulate_season(schedule):
+def simulate_season(schedule, matchups=None, rng=None, league=None):
     """
     Simulate a single season with a given list of Games
 
@@ -93,19 +90,34 @@ def simulate_season(schedule):
     ----------
     schedule: list
         list of Game objects
+    matchups: MatchupCache
+        cache of blended outcome tables (built from the schedule and league
+        if None)
+    rng: int, Generator or RandomStream
+        seed or source of randomness, shared by every Game in the season
+        (None for fresh OS entropy)
+    league: Player
+        league average rates, required to adjust for pitchers when no
+        matchups cache is given
 
     Returns
     -------
 
     """
+    if matchups is None:
+        matchups = MatchupCache(league=league)
+        matchups.precompute(schedule)
+    stream = get_random_stream(
+        rng, block_size=min(100000, GAME_BLOCK_SIZE * max(len(schedule), 1)))
 
     for game in schedule:
-        simulate_game(game)
+        simulate_game(game, matchups=matchups, rng=stream)
 
 
 if __name__ == '__main__':
 
     n_iterations = 10
+    seed = int(sys.argv[1]) if len(sys.argv) > 1 else None
 
     team_wins_dict = defaultdict(lambda: 0, {})
     training_years = {2017, 2018}
@@ -139,11 +151,23 @@ if __name__ == '__main__':
         game = Game(team_dict[tup[0]], team_dict[tup[1]])
         mod_schedule.append(game)
 
+    # No pitching or park data is scraped yet, so every Team keeps a league
+    # average pitcher (Team.pitcher=None) and a neutral park (Team.park=None),
+    # which leaves the batter's own rates. Set them here once that data exists
+    league = create_league_player(player_dict.values())
+    matchups = MatchupCache(league=league)
+    matchups.precompute(mod_schedule)
+
+    # One independent substream per season keeps each run reproducible
+    season_streams = RandomStream(seed).spawn(n_iterations)
+
     for i in range(n_iterations):
         print(i)
 
         simulate_season(
             schedule=mod_schedule,
+            matchups=matchups,
+            rng=season_streams[i]
         )
 
         for team_name, team in team_dict.items():
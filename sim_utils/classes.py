@@ -4,7 +4,7 @@ class Player:
     """
 
     def __init__(self, name, num_seasons, true_BA, perc_singles, perc_doubles,
-                 perc_triples, perc_HR, perc_walk):
+                 perc_triples, perc_HR, perc_walk, num_PA=0):
         """
         Parameters
         ----------
@@ -24,6 +24,8 @@ class Player:
             percentage chance player hits a HR, given they got a hit
         perc_walk: float
             percentage chance player is walked per plate appearance
+        num_PA: int
+            number of plate appearances the rates are based on
         """
         self.name = name
         self.num_seasons = num_seasons
@@ -33,6 +35,74 @@ class Player:
         self.perc_triples = perc_triples
         self.perc_HR = perc_HR
         self.perc_walk = perc_walk
+        self.num_PA = num_PA
+
+
+class Pitcher(Player):
+    """
+    Pitcher class that represents the rates a pitcher allows per plate
+    appearance, using the same fields as the Player batting rates
+    """
+
+    def __init__(self, name, num_seasons, true_BA, perc_singles, perc_doubles,
+                 perc_triples, perc_HR, perc_walk, num_PA=0):
+        """
+        Parameters
+        ----------
+        name: str
+            pitcher name
+        num_seasons: int
+            number of seasons recorded for pitcher
+        true_BA: float
+            hits allowed per batter faced
+        perc_singles: float
+            percentage of hits allowed that are singles
+        perc_doubles: float
+            percentage of hits allowed that are doubles
+        perc_triples: float
+            percentage of hits allowed that are triples
+        perc_HR: float
+            percentage of hits allowed that are HRs
+        perc_walk: float
+            walks allowed per batter faced
+        num_PA: int
+            number of batters faced the rates are based on
+        """
+        super().__init__(name, num_seasons, true_BA, perc_singles,
+                         perc_doubles, perc_triples, perc_HR, perc_walk,
+                         num_PA=num_PA)
+
+
+class Park:
+    """
+    Park class holding multiplicative factors applied to each plate
+    appearance outcome for games played there (1.0 is neutral)
+    """
+
+    def __init__(self, name, single_factor=1.0, double_factor=1.0,
+                 triple_factor=1.0, HR_factor=1.0, walk_factor=1.0):
+        """
+        Parameters
+        ----------
+        name: str
+            park name
+        single_factor: float
+            park factor for singles
+        double_factor: float
+            park factor for doubles
+        triple_factor: float
+            park factor for triples
+        HR_factor: float
+            park factor for HRs
+        walk_factor: float
+            park factor for walks
+        """
+        self.name = name
+        self.single_factor = single_factor
+        self.double_factor = double_factor
+        self.triple_factor = triple_factor
+        self.HR_factor = HR_factor
+        self.walk_factor = walk_factor
 
 
 class Team:
@@ -41,7 +111,8 @@ class Team:
     the number games played and the number of wins the team has earned
     """
 
-    def __init__(self, team_name, lineup=None, games_played=0, num_wins=0):
+    def __init__(self, team_name, lineup=None, games_played=0, num_wins=0,
+                 pitcher=None, park=None):
         """
         Parameters
         ----------
@@ -53,6 +124,10 @@ class Team:
             number of games played
         num_wins: int
             number of games won
+        pitcher: Pitcher
+            pitcher faced by opposing batters (None for league average)
+        park: Park
+            home park (None for a neutral park)
         """
         self.name = team_name
         if not lineup:
@@ -61,6 +136,8 @@ class Team:
             self.lineup = lineup
         self.games_played = games_played
         self.num_wins = num_wins
+        self.pitcher = pitcher
+        self.park = park
 
     def get_winning_percentage(self):
         return self.num_wins / self.games_played
@@ -68,6 +145,9 @@ class Team:
     def set_lineup(self, new_lineup):
         self.lineup = new_lineup
 
+    def set_pitcher(self, new_pitcher):
+        self.pitcher = new_pitcher
+
     def print_record(self):
         print(self.name, ': ', self.num_wins, '-', self.games_played - self.num_wins)
 
@@ -122,7 +202,7 @@ class Score:
 
 
 class GameState:
-    # TODO: Add batter, pitcher? #
+    # TODO: Add batter? (pitchers are tracked per Team) #
     """
     Class to keep track of state of a particular Game
     """
@@ -0,0 +1,198 @@
+from sim_utils.classes import *
+from itertools import accumulate
+
+# Plate appearance outcomes, in the order used by every outcome table
+PA_OUTCOMES = ['out', 'walk', 1, 2, 3, 4]
+
+
+def get_outcome_probs(player):
+    """
+    Convert a Player (or Pitcher) into absolute per-PA outcome probabilities
+
+    Parameters
+    ----------
+    player: Player
+        Player or Pitcher object
+
+    Returns
+    -------
+    list
+        probabilities in PA_OUTCOMES order
+    """
+    return [
+        1 - player.true_BA - player.perc_walk,
+        player.perc_walk,
+        player.true_BA * player.perc_singles,
+        player.true_BA * player.perc_doubles,
+        player.true_BA * player.perc_triples,
+        player.true_BA * player.perc_HR
+    ]
+
+
+def get_park_factors(park):
+    """
+    Get the park factors for each outcome in PA_OUTCOMES order
+
+    Parameters
+    ----------
+    park: Park
+        Park object, or None for a neutral park
+
+    Returns
+    -------
+    list
+        park factors in PA_OUTCOMES order
+    """
+    if not park:
+        return [1.0] * len(PA_OUTCOMES)
+
+    return [
+        1.0,
+        park.walk_factor,
+        park.single_factor,
+        park.double_factor,
+        park.triple_factor,
+        park.HR_factor
+    ]
+
+
+def get_odds_ratio_prob(batter_prob, pitcher_prob, league_prob):
+    """
+    Combine a single outcome probability with the odds-ratio (log5) method
+
+    Parameters
+    ----------
+    batter_prob: float
+        batter's probability of the outcome
+    pitcher_prob: float
+        pitcher's probability of allowing the outcome
+    league_prob: float
+        league probability of the outcome
+
+    Returns
+    -------
+    float
+        matchup probability of the outcome (before normalizing)
+    """
+    if not 0 < league_prob < 1:
+        return batter_prob
+    if batter_prob >= 1 or pitcher_prob >= 1:
+        return 1.0
+
+    odds = (batter_prob / (1 - batter_prob)) * \
+           (pitcher_prob / (1 - pitcher_prob)) / \
+           (league_prob / (1 - league_prob))
+
+    return odds / (1 + odds)
+
+
+def blend_matchup(batter, pitcher, league, park=None):
+    """
+    Blend batter, pitcher and league rates with the odds-ratio (log5) method,
+    then apply park factors
+
+    Parameters
+    ----------
+    batter: Player
+        batter at the plate
+    pitcher: Pitcher
+        opposing pitcher, or None for a league average pitcher
+    league: Player
+        league average rates, required when a pitcher is given
+    park: Park
+        park the game is played in, or None for a neutral park
+
+    Returns
+    -------
+    list
+        normalized probabilities in PA_OUTCOMES order
+    """
+    batter_probs = get_outcome_probs(batter)
+
+    if pitcher:
+        if not league:
+            raise ValueError('league rates are required to adjust for '
+                             'pitcher ' + pitcher.name)
+        pitcher_probs = get_outcome_probs(pitcher)
+        league_probs = get_outcome_probs(league)
+        probs = [get_odds_ratio_prob(b, p, l) for b, p, l in
+                 zip(batter_probs, pitcher_probs, league_probs)]
+    else:
+        probs = batter_probs
+
+    probs = [prob * factor for prob, factor in
+             zip(probs, get_park_factors(park))]
+
+    total = sum(probs)
+    return [prob / total for prob in probs]
+
+
+class MatchupCache:
+    """
+    Cache of cumulative outcome tables keyed by (batter, pitcher, park), so
+    that the blending only happens once per matchup rather than once per PA
+    """
+
+    def __init__(self, league=None):
+        """
+        Parameters
+        ----------
+        league: Player
+            league average rates, required to adjust for pitchers
+        """
+        self.league = league
+        self.tables = {}
+
+    @staticmethod
+    def get_key(batter, pitcher=None, park=None):
+        # Key on the objects themselves (identity), so a Player rebuilt under
+        # the same name, e.g. by update_player, gets its own table
+        return batter, pitcher, park
+
+    def get_cum_probs(self, batter, pitcher=None, park=None):
+        """
+        Look up the cumulative outcome table for a matchup, blending it on a
+        cache miss, so an outcome can be drawn from a single uniform with a
+        bisect
+
+        Parameters
+        ----------
+        batter: Player
+            batter at the plate
+        pitcher: Pitcher
+            opposing pitcher
+        park: Park
+            park the game is played in
+
+        Returns
+        -------
+        list
+            cumulative probabilities in PA_OUTCOMES order, ending in 1.0
+        """
+        key = self.get_key(batter, pitcher, park)
+
+        cum_probs = self.tables.get(key)
+        if cum_probs is None:
+            cum_probs = list(accumulate(
+                blend_matchup(batter, pitcher, self.league, park)))
+            # Guard against rounding so every uniform in [0, 1) maps to an outcome
+            cum_probs[-1] = 1.0
+            self.tables[key] = cum_probs
+
+        return cum_probs
+
+    def precompute(self, schedule):
+        """
+        Fill the cache with every matchup that can occur in a schedule
+
+        Parameters
+        ----------
+        schedule: list
+            list of Game objects
+        """
+        for game in schedule:
+            park = game.home_team.park
+            for batter in game.away_team.lineup:
+                self.get_cum_probs(batter, game.home_team.pitcher, park)
+            for batter in game.home_team.lineup:
+                self.get_cum_probs(batter, game.away_team.pitcher, park)
@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class RandomStream:
+    """
+    Stream of uniform random numbers drawn from a seedable numpy Generator in
+    large pre-generated blocks, which are refilled lazily as they run out
+    """
+
+    def __init__(self, seed=None, block_size=100000):
+        """
+        Parameters
+        ----------
+        seed: int, SeedSequence or Generator
+            seed for the stream, or an existing Generator to draw from
+            (None for fresh OS entropy)
+        block_size: int
+            number of uniforms generated per block
+        """
+        if isinstance(seed, np.random.Generator):
+            self.rng = seed
+            # Resolved lazily in spawn() so wrapping doesn't touch the stream
+            self.seed_seq = None
+        else:
+            if isinstance(seed, np.random.SeedSequence):
+                self.seed_seq = seed
+            else:
+                self.seed_seq = np.random.SeedSequence(seed)
+            self.rng = np.random.default_rng(self.seed_seq)
+
+        self.block_size = block_size
+        self.block = []
+        self.position = 0
+
+    def refill(self):
+        # tolist() so each draw is a plain float index rather than a numpy
+        # scalar lookup
+        self.block = self.rng.random(self.block_size).tolist()
+        self.position = 0
+
+    def uniform(self):
+        """
+        Get the next uniform random number in [0, 1)
+
+        Returns
+        -------
+        float
+        """
+        if self.position >= len(self.block):
+            self.refill()
+
+        value = self.block[self.position]
+        self.position += 1
+        return value
+
+    def spawn(self, n_streams):
+        """
+        Create independent substreams, e.g. one per season or worker
+
+        Parameters
+        ----------
+        n_streams: int
+            number of substreams
+
+        Returns
+        -------
+        list
+            list of RandomStream objects
+        """
+        if self.seed_seq is None:
+            self.seed_seq = getattr(self.rng.bit_generator, 'seed_seq', None)
+        if self.seed_seq is None:
+            self.seed_seq = np.random.SeedSequence(
+                self.rng.integers(0, 2 ** 32, size=4))
+
+        return [RandomStream(child, block_size=self.block_size)
+                for child in self.seed_seq.spawn(n_streams)]
+
+
+def get_random_stream(rng=None, block_size=100000):
+    """
+    Get a RandomStream from a seed, Generator or existing RandomStream
+
+    Parameters
+    ----------
+    rng: int, Generator or RandomStream
+        source of randomness (None for fresh OS entropy)
+    block_size: int
+        block size for a new stream, scaled to the draws the caller expects
+        (ignored for an existing RandomStream)
+
+    Returns
+    -------
+    RandomStream
+    """
+    if isinstance(rng, RandomStream):
+        return rng
+
+    return RandomStream(rng, block_size=block_size)
@@ -98,7 +98,8 @@ def create_player_from_row(player_row):
         perc_doubles=player_2B / player_hits,
         perc_triples=player_3B / player_hits,
         perc_HR=player_HR / player_hits,
-        perc_walk=player_walks / player_PA
+        perc_walk=player_walks / player_PA,
+        num_PA=player_PA
     )
 
 def update_player(curr_player, update_player):
@@ -147,5 +148,54 @@ def update_player(curr_player, update_player):
         perc_doubles=perc_doubles,
         perc_triples=perc_triples,
         perc_HR=perc_HR,
-        perc_walk=perc_walk
+        perc_walk=perc_walk,
+        num_PA=curr_player.num_PA + update_player.num_PA
+    )
+
+
+def create_league_player(players):
+    """
+    Create a league average Player from a collection of Players, to be used as
+    the baseline when blending batter and pitcher rates. Each player's counts
+    are weighted by their plate appearances (equally if none are recorded),
+    and each Player object is only counted once
+
+    Parameters
+    ----------
+    players: list
+        list of Player objects
+
+    Returns
+    -------
+    Player
+        Player object with league average stats
+    """
+    # De-duplicate by identity, e.g. when players are gathered from lineups
+    players = list({id(player): player for player in players
+                    if player}.values())
+    if not players:
+        raise ValueError('cannot create a league average from no players')
+
+    weights = [player.num_PA for player in players]
+    if not sum(weights):
+        weights = [1] * len(players)
+
+    num_PA = sum(weights)
+    hits = sum(w * p.true_BA for w, p in zip(weights, players))
+    walks = sum(w * p.perc_walk for w, p in zip(weights, players))
+    singles = sum(w * p.true_BA * p.perc_singles for w, p in zip(weights, players))
+    doubles = sum(w * p.true_BA * p.perc_doubles for w, p in zip(weights, players))
+    triples = sum(w * p.true_BA * p.perc_triples for w, p in zip(weights, players))
+    HRs = sum(w * p.true_BA * p.perc_HR for w, p in zip(weights, players))
+
+    return Player(
+        name='League Average',
+        num_seasons=1,
+        true_BA=hits / num_PA,
+        perc_singles=singles / hits,
+        perc_doubles=doubles / hits,
+        perc_triples=triples / hits,
+        perc_HR=HRs / hits,
+        perc_walk=walks / num_PA,
+        num_PA=num_PA
     )
@@ -0,0 +1,73 @@
+import pytest
+
+from sim_utils.matchups import *
+
+
+def make_player(name='Batter', true_BA=.25, perc_walk=.1, num_PA=500):
+    return Player(name=name, num_seasons=1, true_BA=true_BA, perc_singles=.6,
+                  perc_doubles=.2, perc_triples=.05, perc_HR=.15,
+                  perc_walk=perc_walk, num_PA=num_PA)
+
+
+def make_pitcher(name='Pitcher', true_BA=.2, perc_walk=.06):
+    return Pitcher(name=name, num_seasons=1, true_BA=true_BA, perc_singles=.7,
+                   perc_doubles=.2, perc_triples=.02, perc_HR=.08,
+                   perc_walk=perc_walk)
+
+
+def test_neutral_matchup_returns_batter_rates():
+    batter = make_player()
+    league = make_player(name='League', true_BA=.24, perc_walk=.09)
+    league_pitcher = Pitcher(name='League Pitcher', num_seasons=1,
+                             true_BA=league.true_BA,
+                             perc_singles=league.perc_singles,
+                             perc_doubles=league.perc_doubles,
+                             perc_triples=league.perc_triples,
+                             perc_HR=league.perc_HR,
+                             perc_walk=league.perc_walk)
+
+    expected = get_outcome_probs(batter)
+    assert blend_matchup(batter, None, None) == pytest.approx(expected)
+    assert blend_matchup(batter, league_pitcher, league, Park('Neutral')) == \
+        pytest.approx(expected)
+
+
+def test_blend_matchup_sums_to_one():
+    league = make_player(name='League', true_BA=.24, perc_walk=.09)
+    park = Park('Coors', single_factor=1.1, HR_factor=1.3, walk_factor=.9)
+    probs = blend_matchup(make_player(), make_pitcher(), league, park)
+
+    assert sum(probs) == pytest.approx(1)
+    assert all(prob >= 0 for prob in probs)
+
+
+def test_blend_matchup_uses_odds_ratio():
+    assert get_odds_ratio_prob(.3, .3, .25) == pytest.approx(
+        (.3 / .7) ** 2 / (.25 / .75) / (1 + (.3 / .7) ** 2 / (.25 / .75)))
+    assert get_odds_ratio_prob(.3, .25, .25) == pytest.approx(.3)
+
+
+def test_blend_matchup_requires_league_for_pitcher():
+    with pytest.raises(ValueError):
+        blend_matchup(make_player(), make_pitcher(), None)
+
+
+def test_cum_probs_end_at_one_and_are_cached():
+    league = make_player(name='League', true_BA=.24, perc_walk=.09)
+    cache = MatchupCache(league=league)
+    batter = make_player()
+    pitcher = make_pitcher()
+
+    cum_probs = cache.get_cum_probs(batter, pitcher)
+    assert cum_probs[-1] == 1.0
+    assert cum_probs == sorted(cum_probs)
+    assert cache.get_cum_probs(batter, pitcher) is cum_probs
+
+
+def test_cache_keys_on_player_objects():
+    cache = MatchupCache()
+    cum_probs = cache.get_cum_probs(make_player(true_BA=.2))
+    rebuilt_probs = cache.get_cum_probs(make_player(true_BA=.3))
+
+    assert cum_probs != rebuilt_probs
+
@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from sim_utils.random_streams import *
+
+
+def draw(stream, n):
+    return [stream.uniform() for _ in range(n)]
+
+
+def test_same_seed_gives_same_draws_across_refills():
+    first = RandomStream(7, block_size=10)
+    second = RandomStream(7, block_size=1000)
+
+    assert draw(first, 25) == draw(second, 25)
+    assert all(0 <= value < 1 for value in draw(first, 25))
+
+
+def test_spawn_is_reproducible_and_independent():
+    children = RandomStream(7).spawn(2)
+    children_again = RandomStream(7).spawn(2)
+
+    assert draw(children[0], 10) == draw(children_again[0], 10)
+    assert draw(children[1], 10) != draw(children_again[0], 10)
+
+
+def test_wrapping_generator_does_not_advance_it():
+    rng = np.random.default_rng(7)
+    RandomStream(rng)
+
+    assert rng.random() == np.random.default_rng(7).random()
+
+
+def test_spawn_from_generator_is_reproducible():
+    children = RandomStream(np.random.default_rng(7)).spawn(1)
+    children_again = RandomStream(np.random.default_rng(7)).spawn(1)
+
+    assert draw(children[0], 10) == draw(children_again[0], 10)
+
+
+def test_get_random_stream():
+    stream = RandomStream(7)
+
+    assert get_random_stream(stream) is stream
+    assert get_random_stream(7, block_size=16).block_size == 16
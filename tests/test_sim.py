@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip('numpy')
+sim = pytest.importorskip('sim')
+
+from sim_utils.classes import *
+
+
+def make_team(name, pitcher=None):
+    lineup = [Player(name=name + str(i), num_seasons=1, true_BA=.2 + i / 100,
+                     perc_singles=.6, perc_doubles=.2, perc_triples=.05,
+                     perc_HR=.15, perc_walk=.08, num_PA=500)
+              for i in range(9)]
+    return Team(name, lineup=lineup, pitcher=pitcher)
+
+
+def test_default_matchups_require_league_for_pitcher():
+    ace = Pitcher(name='Ace', num_seasons=1, true_BA=.15, perc_singles=.7,
+                  perc_doubles=.2, perc_triples=.02, perc_HR=.08,
+                  perc_walk=.04)
+    game = Game(make_team('Away'), make_team('Home', pitcher=ace))
+
+    with pytest.raises(ValueError):
+        sim.simulate_game(game, rng=7)
+
+
+def test_season_league_adjusts_for_pitcher():
+    ace = Pitcher(name='Ace', num_seasons=1, true_BA=.15, perc_singles=.7,
+                  perc_doubles=.2, perc_triples=.02, perc_HR=.08,
+                  perc_walk=.04)
+    away_team = make_team('Away')
+    league = sim.create_league_player(away_team.lineup)
+    matchups = sim.MatchupCache(league=league)
+    schedule = [Game(away_team, make_team('Home', pitcher=ace))]
+
+    sim.simulate_season(schedule, matchups=matchups, rng=7)
+    batter = away_team.lineup[0]
+
+    assert matchups.get_cum_probs(batter, ace) != \
+        sim.MatchupCache().get_cum_probs(batter)
+
+
+def simulate_scores(seed):
+    away_team = make_team('Away')
+    home_team = make_team('Home')
+    schedule = [Game(away_team, home_team) for _ in range(20)]
+
+    sim.simulate_season(schedule, rng=seed)
+
+    return [game.game_state.score.get_score() for game in schedule]
+
+
+def test_same_seed_gives_identical_season():
+    assert simulate_scores(7) == simulate_scores(7)
+    assert simulate_scores(7) != simulate_scores(8)
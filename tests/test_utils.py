@@ -0,0 +1,34 @@
+import pytest
+
+utils = pytest.importorskip('sim_utils.utils')
+
+from sim_utils.classes import *
+
+
+def make_player(name, true_BA, num_PA):
+    return Player(name=name, num_seasons=1, true_BA=true_BA, perc_singles=.6,
+                  perc_doubles=.2, perc_triples=.05, perc_HR=.15,
+                  perc_walk=.1, num_PA=num_PA)
+
+
+def test_create_league_player_weights_by_PA():
+    regular = make_player('Regular', .3, 600)
+    call_up = make_player('Call Up', .1, 5)
+    league = utils.create_league_player([regular, call_up])
+
+    assert league.true_BA == pytest.approx((.3 * 600 + .1 * 5) / 605)
+    assert league.num_PA == 605
+
+
+def test_create_league_player_counts_each_player_once():
+    regular = make_player('Regular', .3, 600)
+    call_up = make_player('Call Up', .1, 5)
+    league = utils.create_league_player([regular, call_up] * 162 + [None])
+
+    assert league.true_BA == pytest.approx((.3 * 600 + .1 * 5) / 605)
+    assert league.num_PA == 605
+
+
+def test_create_league_player_rejects_no_players():
+    with pytest.raises(ValueError):
+        utils.create_league_player([])